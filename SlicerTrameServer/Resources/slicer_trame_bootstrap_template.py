@@ -5,9 +5,13 @@ Used to configure the environment and find the Slicer dependencies prior to scri
 
 Usage example:
     {{SLICER_BOOTSTRAP_COMMAND}}
+
+When the bootstrap was created with a bytecode cache, the cache can be (re)built without running a script using:
+    <bootstrap command> --prepare
 """
 
 import argparse
+import json
 import os
 import sys
 import pickle
@@ -28,17 +32,84 @@ os.environ.update(pickle.loads(base64.decodebytes(slicer_os_env)))
 # Set slicer PATH
 slicer_app_path: str = {{SLICER_APP_PATH}}  # noqa
 
+# Bytecode cache folder prepared by SlicerTrameServer (None if the bootstrap doesn't use a cache)
+slicer_cache_dir: str | None = {{SLICER_CACHE_DIR}}  # noqa
+slicer_prepare_cache_args: list[str] | None = {{SLICER_PREPARE_CACHE_ARGS}}  # noqa
+slicer_build_fingerprint: dict[str, str] = {{SLICER_BUILD_FINGERPRINT}}  # noqa
+
+
+def is_cache_valid() -> bool:
+    """
+    Check that the cache was prepared for the Slicer build this bootstrap was created with and that the Slicer
+    application didn't change since.
+    """
+    try:
+        manifest = json.loads((Path(slicer_cache_dir) / "manifest.json").read_text())
+        app_mtime = str(Path(slicer_app_path).stat().st_mtime_ns)
+    except (OSError, ValueError):
+        return False
+
+    return manifest.get("fingerprint") == slicer_build_fingerprint and app_mtime == slicer_build_fingerprint.get(
+        "slicer_app_mtime"
+    )
+
+
+def load_cache() -> None:
+    """
+    Use the precompiled bytecode from the cache in the Slicer process if the cache is still valid.
+    """
+    if slicer_cache_dir is None:
+        return
+
+    if not is_cache_valid():
+        print(
+            f"Bootstrap cache '{slicer_cache_dir}' is missing or outdated and will be ignored. "
+            "Run the bootstrap with --prepare or recreate the bootstrap if the Slicer install changed.",
+            file=sys.stderr,
+        )
+        return
+
+    manifest = json.loads((Path(slicer_cache_dir) / "manifest.json").read_text())
+    os.environ["PYTHONPYCACHEPREFIX"] = manifest["pycache_prefix"]
 
-def run_script(script_path: Path, script_args):
+
+def prepare_cache() -> int:
+    """
+    Precompile the bytecode cache using the Slicer application.
+    """
+    if slicer_prepare_cache_args is None:
+        print("Bootstrap was created without bytecode cache. Nothing to prepare.", file=sys.stderr)
+        return 1
+
+    result = subprocess.run(slicer_prepare_cache_args)
+    if result.returncode != 0:
+        return result.returncode
+
+    if not is_cache_valid():
+        print("Slicer install changed since the bootstrap was created. Please recreate the bootstrap.", file=sys.stderr)
+        return 1
+    return 0
+
+
+def run_script(script_path: Path, script_args) -> int:
     # bootstrap path with script folder first
     sys.path.insert(0, script_path.parent.as_posix())
 
     # Run the script
-    subprocess.run([slicer_app_path, "--no-main-window", "--python-script", script_path.as_posix()] + script_args)
+    cmd = [slicer_app_path, "--no-main-window", "--python-script", script_path.as_posix()] + script_args
+    return subprocess.run(cmd).returncode
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Bootstrap 3D Slicer environment and runs the input server script.")
-    parser.add_argument("script_path", type=str, help="Path to Slicer trame server script file.")
+    parser.add_argument("script_path", type=str, nargs="?", help="Path to Slicer trame server script file.")
+    parser.add_argument("--prepare", action="store_true", help="Prepare the bytecode cache and exit.")
     args, unknown_args = parser.parse_known_args()
-    run_script(Path(args.script_path).resolve(), unknown_args)
+    if args.prepare:
+        sys.exit(prepare_cache())
+
+    if args.script_path is None:
+        parser.error("the following arguments are required: script_path")
+
+    load_cache()
+    sys.exit(run_script(Path(args.script_path).resolve(), unknown_args))
@@ -56,6 +56,11 @@ def bootstrapTemplatePath() -> Path:
     return resourcesPath().joinpath("slicer_trame_bootstrap_template.py")
 
 
+def bootstrapCacheDir(bootstrapFilePath: str | Path) -> Path:
+    bootstrapFilePath = Path(bootstrapFilePath)
+    return bootstrapFilePath.parent / f"{bootstrapFilePath.stem}_cache"
+
+
 def trame_slicer_version() -> str:
     try:
         import trame_slicer
@@ -89,6 +94,7 @@ class Widget(qt.QWidget):
 
         self._serverPathSettingsKey = "SlicerTrameServer/ScriptPath"
         self._serverPortSettingsKey = "SlicerTrameServer/ServerPort"
+        self._prepareCacheSettingsKey = "SlicerTrameServer/PrepareBootstrapCache"
 
         layout = qt.QFormLayout(self)
         self._trameSlicerVersionLabel = qt.QLabel(self)
@@ -113,6 +119,18 @@ class Widget(qt.QWidget):
         self._createBootstrapButton.clicked.connect(self._onCreateBootstrapClicked)
         layout.addRow(self._createBootstrapButton)
 
+        self._prepareCacheCheckBox = qt.QCheckBox(_("Prepare bootstrap bytecode cache"))
+        self._prepareCacheCheckBox.setToolTip(
+            _(
+                "Precompile trame, trame-slicer and Slicer Python bytecode in a cache folder next to the bootstrap file."
+                " Speeds up server launches when the Python install is read-only or has no bytecode."
+            )
+        )
+        self._prepareCacheCheckBox.checked = slicer.util.settingsValue(
+            self._prepareCacheSettingsKey, False, converter=slicer.util.toBool
+        )
+        layout.addRow(self._prepareCacheCheckBox)
+
         self._serverPathLineEdit = ctk.ctkPathLineEdit(self)
         self._serverPathLineEdit.filters = ctk.ctkPathLineEdit.Files
         self._serverPathLineEdit.nameFilters = ["*.py"]
@@ -150,6 +168,13 @@ class Widget(qt.QWidget):
         self._process.readyReadStandardError.connect(self._onReadyReadErrorOutput)
         self._process.readyReadStandardOutput.connect(self._onReadyReadStandardOutput)
 
+        self._prepareCacheProcess = qt.QProcess()
+        self._prepareCacheProcess.setProcessChannelMode(qt.QProcess.MergedChannels)
+        self._prepareCacheProcess.finished.connect(self._onPrepareCacheProcessFinished)
+        self._prepareCacheProcess.errorOccurred.connect(self._onPrepareCacheProcessError)
+        self._prepareCacheDialog = None
+        self._preparedBootstrapCommand = ""
+
         self._verbose = verbose
         self._lastError = ""
         self._onProcessFinished()
@@ -438,11 +463,66 @@ class Widget(qt.QWidget):
         if not destPath:
             return
 
+        prepareCache = self._prepareCacheCheckBox.checked
+        self._saveSetting(self._prepareCacheSettingsKey, prepareCache)
+        cacheDir = bootstrapCacheDir(destPath) if prepareCache else None
+
         printableCommand = self._printableCommand(self._getCurrentBootstrappedCommand(destPath))
-        self.createBootstrapFile(destPath, printableCommand)
+        self.createBootstrapFile(destPath, printableCommand, cacheDir)
+        if cacheDir is not None:
+            self._startPrepareBootstrapCache(cacheDir, printableCommand)
+            return
+
+        self._onBootstrapCreated(printableCommand)
+
+    @staticmethod
+    def _onBootstrapCreated(printableCommand: str):
         _infoMsg = f"Bootstrap was created. To use the bootstrap, execute the following command:\n\n{printableCommand}"
         slicer.util.infoDisplay(_infoMsg)
 
+    def _startPrepareBootstrapCache(self, cacheDir: Path, printableCommand: str):
+        """
+        Prepare the bootstrap cache in a separate Slicer process while keeping the application responsive.
+        """
+        self._createBootstrapButton.setEnabled(False)
+        self._preparedBootstrapCommand = printableCommand
+        self._prepareCacheDialog = slicer.util.createProgressDialog(
+            parent=None, maximum=0, labelText="Preparing bytecode cache..."
+        )
+        self._prepareCacheDialog.setCancelButton(None)
+        self._prepareCacheDialog.show()
+
+        program, *args = self.prepareBootstrapCacheCommandArgs(cacheDir)
+        self._prepareCacheProcess.start(program, args)
+
+    def _onPrepareCacheProcessFinished(self, exitCode, exitStatus):
+        self._hidePrepareCacheDialog()
+        if exitStatus != qt.QProcess.NormalExit or exitCode != 0:
+            output = self._prepareCacheProcess.readAll()
+            self._onErrorInfo(
+                f"Failed to prepare the bootstrap cache.\n{qt.QTextCodec.codecForUtfText(output).toUnicode(output)}"
+            )
+            return
+
+        self._onBootstrapCreated(self._preparedBootstrapCommand)
+
+    def _onPrepareCacheProcessError(self, error):
+        # Other errors are followed by the finished signal
+        if error != qt.QProcess.FailedToStart:
+            return
+
+        self._hidePrepareCacheDialog()
+        self._onErrorInfo(f"Failed to start the bootstrap cache preparation: {self._prepareCacheProcess.errorString()}")
+
+    def _hidePrepareCacheDialog(self):
+        self._createBootstrapButton.setEnabled(True)
+        if self._prepareCacheDialog is None:
+            return
+
+        self._prepareCacheDialog.hide()
+        self._prepareCacheDialog.deleteLater()
+        self._prepareCacheDialog = None
+
     @staticmethod
     def _printableCommand(cmdArgs: list[str]):
         return " ".join([f'"{cmd}"' if i_cmd < 3 else cmd for i_cmd, cmd in enumerate(cmdArgs)])
@@ -456,8 +536,19 @@ class Widget(qt.QWidget):
         ]
 
     @classmethod
-    def createBootstrapFile(cls, destFilePath: str | Path, printableCommand: str) -> None:
+    def createBootstrapFile(
+        cls, destFilePath: str | Path, printableCommand: str, cacheDir: str | Path | None = None
+    ) -> None:
+        """
+        Write the bootstrap file configured with the current Slicer environment.
+        If cacheDir is provided, the bootstrap uses the bytecode cache prepared in this folder as long as the cache
+        matches the current Slicer build. The cache is prepared by running the bootstrap with --prepare.
+        """
         destFilePath = Path(destFilePath)
+        cacheDirValue = json.dumps(Path(cacheDir).resolve().as_posix()) if cacheDir is not None else "None"
+        prepareArgsValue = (
+            json.dumps(cls.prepareBootstrapCacheCommandArgs(cacheDir)) if cacheDir is not None else "None"
+        )
         templateContent = bootstrapTemplatePath().read_text()
         templateContent = templateContent.replace("{{SLICER_SYS_PATH}}", json.dumps(sys.path))
         templateContent = templateContent.replace(
@@ -465,8 +556,114 @@ class Widget(qt.QWidget):
         )
         templateContent = templateContent.replace("{{SLICER_BOOTSTRAP_COMMAND}}", printableCommand)
         templateContent = templateContent.replace("{{SLICER_APP_PATH}}", json.dumps(cls._slicerPath().as_posix()))
+        templateContent = templateContent.replace("{{SLICER_CACHE_DIR}}", cacheDirValue)
+        templateContent = templateContent.replace("{{SLICER_PREPARE_CACHE_ARGS}}", prepareArgsValue)
+        templateContent = templateContent.replace(
+            "{{SLICER_BUILD_FINGERPRINT}}", json.dumps(cls.slicerBuildFingerprint(), sort_keys=True)
+        )
         destFilePath.write_text(templateContent)
 
+    @classmethod
+    def slicerBuildFingerprint(cls) -> dict[str, str]:
+        """
+        Identify the Slicer build and Python packages the bootstrap cache was prepared for.
+        """
+        return {
+            "slicer_app_path": cls._slicerPath().as_posix(),
+            "slicer_app_mtime": str(cls._slicerPath().stat().st_mtime_ns),
+            "slicer_version": slicer.app.applicationVersion,
+            "slicer_revision": slicer.app.repositoryRevision,
+            "python_version": sys.version,
+            "trame_slicer_version": trame_slicer_version(),
+        }
+
+    @classmethod
+    def prepareBootstrapCacheCommandArgs(cls, cacheDir: str | Path) -> list[str]:
+        """
+        Return the command preparing the bootstrap cache in a Slicer process launched like the bootstrapped server.
+        """
+        cacheDir = Path(cacheDir).resolve().as_posix()
+        prepareCode = "\n".join(
+            [
+                "import traceback",
+                "import SlicerTrameServer",
+                "try:",
+                f"    SlicerTrameServer.Widget.prepareBootstrapCache({cacheDir!r})",
+                "    slicer.util.exit(0)",
+                "except Exception:",
+                "    traceback.print_exc()",
+                "    slicer.util.exit(1)",
+            ]
+        )
+        return [cls._slicerPath().as_posix(), "--no-main-window", "--python-code", prepareCode]
+
+    @staticmethod
+    def _bootstrapCacheSourceDirs() -> list[str]:
+        """
+        Return the trame, trame-slicer and Slicer sys.path folders to precompile.
+
+        The paths are kept exactly as they appear in sys.path as the bytecode location in the pycache prefix is built
+        from the literal source path. Folders nested in another listed folder are skipped as they are compiled
+        recursively.
+        """
+        import importlib.util
+
+        sourceDirs = []
+        for packageName in ["trame", "trame_slicer"]:
+            spec = importlib.util.find_spec(packageName)
+            if spec is not None and spec.submodule_search_locations:
+                sourceDirs.extend(spec.submodule_search_locations)
+
+        slicerHome = Path(slicer.app.slicerHome).resolve()
+        sourceDirs.extend(
+            sysPath
+            for sysPath in sys.path
+            if sysPath and Path(sysPath).is_dir() and Path(sysPath).resolve().is_relative_to(slicerHome)
+        )
+
+        def isNested(sourceDir: str, parentDir: str) -> bool:
+            parentDir = parentDir.rstrip("/\\")
+            return sourceDir.startswith((parentDir + "/", parentDir + "\\"))
+
+        sourceDirs = list(dict.fromkeys(sourceDirs))
+        return [sourceDir for sourceDir in sourceDirs if not any(isNested(sourceDir, other) for other in sourceDirs)]
+
+    @classmethod
+    def prepareBootstrapCache(cls, cacheDir: str | Path) -> Path:
+        """
+        Precompile the bytecode of the Python packages used by trame-slicer into the cacheDir/pycache prefix and
+        write the Slicer build fingerprint to the cache manifest.
+        The Python install can then be read-only or on a network file system without recompiling at each launch.
+
+        Expected to run in a Slicer process launched by prepareBootstrapCacheCommandArgs to compile the files with the
+        sys.path of the bootstrapped server.
+
+        :returns: Path to the cache manifest file.
+        """
+        import compileall
+
+        cacheDir = Path(cacheDir).resolve()
+        pycachePrefix = cacheDir / "pycache"
+        pycachePrefix.mkdir(parents=True, exist_ok=True)
+
+        # compileall writes the bytecode to the location given by importlib.util.cache_from_source
+        # which honors sys.pycache_prefix. Workers are not used as child processes wouldn't inherit the prefix.
+        previousPrefix = sys.pycache_prefix
+        sys.pycache_prefix = pycachePrefix.as_posix()
+        try:
+            for sourceDir in cls._bootstrapCacheSourceDirs():
+                compileall.compile_dir(sourceDir, quiet=1, workers=1)
+        finally:
+            sys.pycache_prefix = previousPrefix
+
+        manifestPath = cacheDir / "manifest.json"
+        manifest = {
+            "fingerprint": cls.slicerBuildFingerprint(),
+            "pycache_prefix": pycachePrefix.as_posix(),
+        }
+        manifestPath.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+        return manifestPath
+
     @classmethod
     def createBootstrapCommandArgs(cls, bootStrapFilePath: str | Path) -> list[str]:
         bootStrapFilePath = Path(bootStrapFilePath)
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import copy
+import json
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import slicer
+    from vtkmodules.vtkRenderingCore import vtkRenderWindow
+
+
+class WebGLSceneExporter:
+    """
+    Export the geometry of a render window as WebGL objects to render mostly static 3D content on the client side.
+
+    The export relies on the vtkWebGLExporter used by vtkWebApplication. The scene is only parsed again when the
+    rendered props or the MRML display nodes visible in the view are added, removed or modified. Rotating the camera
+    doesn't trigger a new export. Clients synchronize by calling metadata, then send the MD5 of the objects they
+    already loaded to only download the changed ones. The returned metadata is a copy which callers may modify.
+    """
+
+    def __init__(self, renderWindow: vtkRenderWindow, viewNode: slicer.vtkMRMLAbstractViewNode | None = None):
+        from vtkmodules.vtkWebCore import vtkWebApplication
+
+        self._renderWindow = renderWindow
+        self._viewNode = viewNode
+        self._displayNodes: list[slicer.vtkMRMLDisplayNode] = []
+        self._sceneNodesMTime: int | None = None
+        self._webApplication = vtkWebApplication()
+        self._exportSignature: tuple | None = None
+        self._metadata: dict = {}
+        self._objectsMD5: dict[str, str] = {}
+        self._binaryData: dict[tuple[str, str, int], str] = {}
+
+    def sceneSignature(self) -> tuple:
+        """
+        Return the rendered props with their modification times and the MRML display nodes visible in the view with
+        theirs. The signature changes when props or visible display nodes are added, removed or modified.
+        """
+        props = []
+        renderers = self._renderWindow.GetRenderers()
+        for iRenderer in range(renderers.GetNumberOfItems()):
+            viewProps = renderers.GetItemAsObject(iRenderer).GetViewProps()
+            for iProp in range(viewProps.GetNumberOfItems()):
+                prop = viewProps.GetItemAsObject(iProp)
+                mTimes = [prop.GetMTime()]
+
+                mapper = prop.GetMapper() if hasattr(prop, "GetMapper") else None
+                if mapper is not None:
+                    mTimes.append(mapper.GetMTime())
+                    mapperInput = mapper.GetInputDataObject(0, 0)
+                    if mapperInput is not None:
+                        mTimes.append(mapperInput.GetMTime())
+
+                props.append((prop.GetAddressAsString("vtkObject"), *mTimes))
+
+        nodes = tuple((node.GetID(), node.GetMTime()) for node in self._visibleDisplayNodes())
+        return tuple(props), nodes
+
+    def _visibleDisplayNodes(self) -> list[slicer.vtkMRMLDisplayNode]:
+        if self._viewNode is None or self._viewNode.GetScene() is None:
+            return []
+
+        # The display nodes are only listed again when nodes are added to or removed from the scene
+        scene = self._viewNode.GetScene()
+        sceneNodesMTime = scene.GetNodes().GetMTime()
+        if sceneNodesMTime != self._sceneNodesMTime:
+            import slicer
+
+            self._displayNodes = slicer.util.getNodesByClass("vtkMRMLDisplayNode", scene=scene)
+            self._sceneNodesMTime = sceneNodesMTime
+
+        viewNodeID = self._viewNode.GetID()
+        return [node for node in self._displayNodes if node.GetVisibility(viewNodeID)]
+
+    def metadata(self) -> dict:
+        """
+        Return the WebGL scene metadata and synchronize the export with the scene.
+        The scene is exported again only if it was modified since the last export. It is expected to be called once
+        per client synchronization. The camera information of the metadata is the one of the last export.
+        """
+        if self.sceneSignature() != self._exportSignature:
+            self._exportScene()
+        return copy.deepcopy(self._metadata)
+
+    def _exportScene(self) -> None:
+        # Exporting the scene modifies the mappers. The signature is read afterward to detect later changes only.
+        self._metadata = json.loads(self._webApplication.GetWebGLSceneMetaData(self._renderWindow))
+        self._exportSignature = self.sceneSignature()
+        self._objectsMD5 = {str(obj["id"]): obj["md5"] for obj in self._metadata.get("Objects", [])}
+
+        # Only keep the binary data of the objects which didn't change
+        self._binaryData = {
+            key: data for key, data in self._binaryData.items() if self._objectsMD5.get(key[0]) == key[1]
+        }
+
+    def _exportedObjectsMD5(self) -> dict[str, str]:
+        if self._exportSignature is None:
+            self._exportScene()
+        return self._objectsMD5
+
+    def changedObjectIds(self, knownObjects: dict[str, str]) -> list[str]:
+        """
+        Return the ids of the objects of the last export which are missing or have a different MD5 in knownObjects.
+
+        :param knownObjects: Object id to MD5 of the objects already loaded by the client.
+        """
+        return [
+            objectId
+            for objectId, objectMD5 in self._exportedObjectsMD5().items()
+            if knownObjects.get(objectId) != objectMD5
+        ]
+
+    def removedObjectIds(self, knownObjects: dict[str, str]) -> list[str]:
+        """
+        Return the ids of the objects in knownObjects which are not part of the last export anymore.
+        """
+        objectsMD5 = self._exportedObjectsMD5()
+        return [objectId for objectId in knownObjects if objectId not in objectsMD5]
+
+    def binaryData(self, objectId: str, part: int) -> str:
+        """
+        Return the base64 encoded WebGL data of the given object part of the last export.
+        Parts are numbered from 0 to the object "parts" metadata value excluded.
+        """
+        objectId = str(objectId)
+        objectMD5 = self._exportedObjectsMD5().get(objectId)
+        if objectMD5 is None:
+            return ""
+
+        key = (objectId, objectMD5, part)
+        if key not in self._binaryData:
+            self._binaryData[key] = self._webApplication.GetWebGLBinaryData(self._renderWindow, objectId, part)
+        return self._binaryData[key]
@@ -0,0 +1,3 @@
+from .WebGLSceneExporter import WebGLSceneExporter
+
+__all__ = ["WebGLSceneExporter"]
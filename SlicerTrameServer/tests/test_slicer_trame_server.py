@@ -1,3 +1,4 @@
+import json
 import os
 import signal
 import subprocess
@@ -8,7 +9,7 @@ import pytest
 import qt
 import slicer
 
-from SlicerTrameServer import Widget, minimalExamplePath
+from SlicerTrameServer import Widget, bootstrapCacheDir, minimalExamplePath
 
 
 @pytest.fixture
@@ -87,3 +88,79 @@ def test_can_run_bootstrapped_script_with_proposed_command(a_bootstrap, a_widget
         assert proc.poll() is None
     finally:
         os.kill(proc.pid, signal.SIGTERM)
+
+
+def create_cached_bootstrap(dest_dir):
+    dest_file = Path(dest_dir) / "slicer_trame_bootstrap.py"
+    Widget.createBootstrapFile(dest_file, "EXAMPLE_COMMAND", bootstrapCacheDir(dest_file))
+    return dest_file
+
+
+def run_bootstrap(bootstrap, *args):
+    bootstrap_command = Widget.createBootstrapCommandArgs(bootstrap)
+    return subprocess.run([*bootstrap_command, *args], capture_output=True, text=True)
+
+
+@pytest.fixture(scope="module")
+def a_prepared_bootstrap(tmp_path_factory):
+    # Preparing compiles the Slicer Python tree. It is done once and shared by the tests which don't modify the cache.
+    bootstrap = create_cached_bootstrap(tmp_path_factory.mktemp("prepared_bootstrap"))
+    result = run_bootstrap(bootstrap, "--prepare")
+    assert result.returncode == 0, f"Preparation failed: {result.stderr}"
+    return bootstrap
+
+
+def manifest_path(bootstrap):
+    return bootstrapCacheDir(bootstrap) / "manifest.json"
+
+
+def pycache_snapshot(bootstrap):
+    pycache_prefix = Path(json.loads(manifest_path(bootstrap).read_text())["pycache_prefix"])
+    return {pyc_file: pyc_file.stat().st_mtime_ns for pyc_file in pycache_prefix.rglob("*.pyc")}
+
+
+def is_trame_slicer_file(path):
+    return "trame_slicer" in path.parts
+
+
+def test_can_prepare_bootstrap_cache(a_prepared_bootstrap):
+    manifest = json.loads(manifest_path(a_prepared_bootstrap).read_text())
+
+    assert manifest["fingerprint"] == Widget.slicerBuildFingerprint()
+    assert any(is_trame_slicer_file(pyc_file) for pyc_file in pycache_snapshot(a_prepared_bootstrap))
+
+
+def test_bootstrapped_script_uses_prepared_cache(a_prepared_bootstrap, tmpdir):
+    my_script_file = Path(tmpdir) / "my_script.py"
+    my_script_file.write_text("import trame_slicer; import slicer;")
+    snapshot_before = pycache_snapshot(a_prepared_bootstrap)
+
+    result = run_bootstrap(a_prepared_bootstrap, my_script_file.as_posix())
+    assert result.returncode == 0, f"Execution failed: {result.stderr}"
+    assert "outdated" not in result.stderr
+
+    # The precompiled bytecode is loaded as is and no trame-slicer bytecode needed to be compiled
+    snapshot_after = pycache_snapshot(a_prepared_bootstrap)
+    assert all(snapshot_after[pyc_file] == mtime for pyc_file, mtime in snapshot_before.items())
+    assert not [pyc_file for pyc_file in set(snapshot_after) - set(snapshot_before) if is_trame_slicer_file(pyc_file)]
+
+
+def test_bootstrap_ignores_outdated_cache(a_prepared_bootstrap, tmpdir):
+    # Use a copy of the prepared manifest to keep the shared cache untouched
+    outdated_bootstrap = create_cached_bootstrap(tmpdir)
+    manifest = json.loads(manifest_path(a_prepared_bootstrap).read_text())
+    manifest["fingerprint"]["slicer_revision"] = "outdated"
+    manifest_path(outdated_bootstrap).parent.mkdir(parents=True)
+    manifest_path(outdated_bootstrap).write_text(json.dumps(manifest))
+
+    my_script_file = Path(tmpdir) / "my_script.py"
+    my_script_file.write_text("import slicer;")
+    result = run_bootstrap(outdated_bootstrap, my_script_file.as_posix())
+
+    assert result.returncode == 0, f"Execution failed: {result.stderr}"
+    assert "outdated" in result.stderr
+
+
+def test_bootstrap_without_cache_cannot_be_prepared(a_bootstrap):
+    result = run_bootstrap(a_bootstrap, "--prepare")
+    assert result.returncode != 0
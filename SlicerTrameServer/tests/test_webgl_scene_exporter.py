@@ -0,0 +1,178 @@
+import pytest
+import slicer
+from vtkmodules.vtkFiltersSources import vtkConeSource, vtkSphereSource
+from vtkmodules.vtkRenderingCore import vtkActor, vtkPolyDataMapper, vtkRenderer, vtkRenderWindow
+
+from SlicerTrameServerLib import WebGLSceneExporter
+
+
+@pytest.fixture
+def a_sphere_source():
+    return vtkSphereSource()
+
+
+def create_actor(source):
+    mapper = vtkPolyDataMapper()
+    mapper.SetInputConnection(source.GetOutputPort())
+    actor = vtkActor()
+    actor.SetMapper(mapper)
+    return actor
+
+
+@pytest.fixture
+def a_render_window(a_sphere_source):
+    renderer = vtkRenderer()
+    renderer.AddActor(create_actor(a_sphere_source))
+
+    render_window = vtkRenderWindow()
+    render_window.SetOffScreenRendering(True)
+    render_window.AddRenderer(renderer)
+    render_window.Render()
+    return render_window
+
+
+@pytest.fixture
+def an_exporter(a_render_window):
+    return WebGLSceneExporter(a_render_window)
+
+
+def known_objects(exporter):
+    return {str(obj["id"]): obj["md5"] for obj in exporter.metadata()["Objects"]}
+
+
+def count_exports(exporter, monkeypatch):
+    exports = []
+    export_scene = exporter._exportScene
+
+    def counted_export_scene():
+        exports.append(True)
+        export_scene()
+
+    monkeypatch.setattr(exporter, "_exportScene", counted_export_scene)
+    return exports
+
+
+def test_exports_scene_objects(an_exporter):
+    metadata = an_exporter.metadata()
+    assert len(metadata["Objects"]) == 1
+
+    object_id = str(metadata["Objects"][0]["id"])
+    assert an_exporter.binaryData(object_id, 0)
+
+
+def test_scene_is_not_exported_again_if_unmodified(an_exporter, a_render_window, monkeypatch):
+    previous_objects = known_objects(an_exporter)
+    exports = count_exports(an_exporter, monkeypatch)
+
+    a_render_window.GetRenderers().GetFirstRenderer().GetActiveCamera().Azimuth(45)
+    a_render_window.Render()
+
+    assert known_objects(an_exporter) == previous_objects
+    assert not exports
+
+
+def test_metadata_can_be_modified_by_caller(an_exporter):
+    an_exporter.metadata()["Objects"].clear()
+    assert an_exporter.metadata()["Objects"]
+
+
+def test_only_modified_objects_are_changed(an_exporter, a_render_window, a_sphere_source):
+    a_render_window.GetRenderers().GetFirstRenderer().AddActor(create_actor(vtkConeSource()))
+    a_render_window.Render()
+    previous_objects = known_objects(an_exporter)
+    assert len(previous_objects) == 2
+
+    a_sphere_source.SetThetaResolution(32)
+    a_render_window.Render()
+    an_exporter.metadata()
+
+    changed_ids = an_exporter.changedObjectIds(previous_objects)
+    assert len(changed_ids) == 1
+    assert changed_ids[0] in previous_objects
+    assert not an_exporter.changedObjectIds(known_objects(an_exporter))
+
+
+def test_removed_objects_are_reported(an_exporter, a_render_window):
+    previous_objects = known_objects(an_exporter)
+
+    a_render_window.GetRenderers().GetFirstRenderer().RemoveAllViewProps()
+    a_render_window.Render()
+    an_exporter.metadata()
+
+    assert an_exporter.removedObjectIds(previous_objects) == list(previous_objects)
+
+
+def test_removing_older_actor_is_reported(an_exporter, a_render_window):
+    renderer = a_render_window.GetRenderers().GetFirstRenderer()
+    older_actor = renderer.GetActors().GetLastActor()
+    renderer.AddActor(create_actor(vtkConeSource()))
+    a_render_window.Render()
+    previous_objects = known_objects(an_exporter)
+    assert len(previous_objects) == 2
+
+    renderer.RemoveActor(older_actor)
+    a_render_window.Render()
+    an_exporter.metadata()
+
+    assert len(an_exporter.removedObjectIds(previous_objects)) == 1
+    assert not an_exporter.changedObjectIds(previous_objects)
+
+
+def test_adding_prebuilt_actor_is_reported(an_exporter, a_render_window):
+    prebuilt_actor = create_actor(vtkConeSource())
+    previous_objects = known_objects(an_exporter)
+
+    a_render_window.GetRenderers().GetFirstRenderer().AddActor(prebuilt_actor)
+    a_render_window.Render()
+    an_exporter.metadata()
+
+    assert len(an_exporter.changedObjectIds(previous_objects)) == 1
+
+
+def test_binary_data_uses_last_export(an_exporter, a_render_window):
+    object_id = next(iter(known_objects(an_exporter)))
+
+    a_render_window.GetRenderers().GetFirstRenderer().RemoveAllViewProps()
+    a_render_window.Render()
+
+    assert an_exporter.binaryData(object_id, 0)
+
+
+@pytest.fixture
+def a_model_node():
+    sphere = vtkSphereSource()
+    sphere.Update()
+    model_node = slicer.modules.models.logic().AddModel(sphere.GetOutput())
+    yield model_node
+    slicer.mrmlScene.RemoveNode(model_node)
+
+
+@pytest.fixture
+def a_3d_view_exporter(a_model_node):
+    view = slicer.app.layoutManager().threeDWidget(0).threeDView()
+    view.forceRender()
+    exporter = WebGLSceneExporter(view.renderWindow(), view.mrmlViewNode())
+    exporter.metadata()
+    return exporter
+
+
+def test_modified_display_node_triggers_export(a_3d_view_exporter, a_model_node, monkeypatch):
+    exports = count_exports(a_3d_view_exporter, monkeypatch)
+
+    a_model_node.GetDisplayNode().SetColor(1, 0, 0)
+    a_3d_view_exporter.metadata()
+
+    assert len(exports) == 1
+
+
+def test_unrelated_camera_change_does_not_trigger_export(a_3d_view_exporter, monkeypatch):
+    exports = count_exports(a_3d_view_exporter, monkeypatch)
+
+    camera_node = slicer.mrmlScene.AddNewNodeByClass("vtkMRMLCameraNode")
+    try:
+        camera_node.SetPosition(100, 0, 0)
+        a_3d_view_exporter.metadata()
+    finally:
+        slicer.mrmlScene.RemoveNode(camera_node)
+
+    assert not exports